@@ -1,11 +1,12 @@
 """Module contains PiShock client to interact with PiShock"""
 
 import logging
-from datetime import datetime, timedelta
+import time
 from enum import Enum
 from typing import Final
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from vrchat_osc_scripts.config import Config
 
@@ -24,12 +25,20 @@ class PiShockClient:
     """Client to send commands to the PiShock API."""
 
     API_URL: Final[str] = "https://do.pishock.com/api/apioperate"
+    # Connect and read timeouts in seconds
+    REQUEST_TIMEOUT: Final[tuple[float, float]] = (3, 10)
 
     def __init__(self) -> None:
         """Initialize the client using creds from env vars"""
         if not any((Config.PISHOCK_USERNAME, Config.PISHOCK_API_KEY, Config.PISHOCK_CODE)):
             raise ValueError("One of PiShock credentials is not set in environment variables")
-        self._last_shock_time: datetime | None = None
+        # Monotonic clock seconds of the last sent command
+        self._last_shock_time: float | None = None
+
+        # Keep the connection to PiShock alive between commands to skip TCP and TLS handshakes
+        self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
     def send_command(
         self,
@@ -61,22 +70,25 @@ class PiShockClient:
         }
         if payload["Intensity"] > Config.MAX_SHOCK_INTENSITY_SAFE_GUARD:
             raise ValueError(f"SAFE GUARD PREVENTED INTENSITY HIGHER THAN {Config.MAX_SHOCK_INTENSITY_SAFE_GUARD}")
-        headers = {"Content-Type": "application/json"}
         if self._last_shock_time is not None:
-            time_since_last_shock = datetime.now() - self._last_shock_time
-            if time_since_last_shock <= Config.SHOCK_COOLDOWN_TIME:
+            time_since_last_shock = time.monotonic() - self._last_shock_time
+            if time_since_last_shock <= Config.SHOCK_COOLDOWN_TIME.total_seconds():
                 logger.info(
-                    f"PiShock command rejected, cool down is not done. "
-                    f"Passed: {time_since_last_shock.total_seconds()}s"
+                    "PiShock command rejected, cool down is not done. Passed: %ss",
+                    time_since_last_shock,
                 )
                 return False
 
         logger.info(
-            f"Sending PiShock command {name} with operation {operation.name}, and intensity {intensity}, "
-            f"and duration {duration}"
+            "Sending PiShock command %s with operation %s, and intensity %s, and duration %s",
+            name,
+            operation.name,
+            intensity,
+            duration,
         )
-        self._last_shock_time = datetime.now()
-        response = requests.post(self.API_URL, json=payload, headers=headers, timeout=30)
-        logger.info(response.text)
+        self._last_shock_time = time.monotonic()
+        response = self._session.post(self.API_URL, json=payload, timeout=self.REQUEST_TIMEOUT)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PiShock response: %s", response.text)
         response.raise_for_status()
         return True
@@ -4,16 +4,101 @@ Defines VRChatOSCReceiver to listen for OSC parameter changes from VRChat,
 manage registered handlers, and notify them on parameter updates.
 """
 
+import asyncio
 import logging
-from typing import Any
+import queue
+import socket
+import sys
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc_server import BlockingOSCUDPServer
+from pythonosc.osc_packet import OscPacket, ParseError
 
 from vrchat_osc_scripts.config import Config
 
+if TYPE_CHECKING:
+    from vrchat_osc_scripts.handlers.base import BaseHandler
+
 logger = logging.getLogger(__name__)
 
+# Handlers to notify, or the workers of blocking ones, paired with the handler class name
+_HandlerGroup = list[tuple["BaseHandler | _HandlerWorker", str]]
+
+# Address prefix of avatar parameter messages, everything else is ignored
+_PARAMETER_ADDRESS_PREFIX = "/avatar/parameters/"
+
+# Marks a parameter that has not been received yet, so its first value is always dispatched
+_UNSET: Any = object()
+
+
+class _HandlerWorker:
+    """Run a blocking handler on its own thread, fed through a bounded queue.
+
+    When the queue is full the oldest pending update is dropped, so a hung
+    handler can never stall the OSC reader.
+    """
+
+    QUEUE_SIZE = 256
+
+    def __init__(self, handler: "BaseHandler") -> None:
+        """Start the worker thread for the given handler.
+
+        :param handler: Handler to call from the worker thread.
+        """
+        self._handler = handler
+        self._handler_name = type(handler).__name__
+        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._run, name=f"{self._handler_name}Worker", daemon=True)
+        self._thread.start()
+
+    def on_parameter_changed(self, parameter: str, value: Any) -> None:
+        """Queue a parameter change for the handler without blocking.
+
+        :param parameter: The name of the changed parameter.
+        :param value: The new value of the parameter.
+        """
+        while True:
+            try:
+                self._queue.put_nowait((parameter, value))
+                return
+            except queue.Full:
+                try:
+                    dropped_parameter, _ = self._queue.get_nowait()
+                    logger.warning(
+                        "Handler %s is behind, dropped update of '%s'", self._handler_name, dropped_parameter
+                    )
+                except queue.Empty:
+                    pass
+
+    def _run(self) -> None:
+        """Deliver queued parameter changes to the handler forever."""
+        while True:
+            parameter, value = self._queue.get()
+            try:
+                self._handler.on_parameter_changed(parameter, value)
+            except Exception as error:
+                logger.error("Error in handler %s for '%s': %s", self._handler_name, parameter, error)
+
+
+class _OSCProtocol(asyncio.DatagramProtocol):
+    """Forward every received datagram to a callback."""
+
+    def __init__(self, handle_datagram: Callable[[bytes], None]) -> None:
+        """Create a protocol that forwards datagrams to the given callback.
+
+        :param handle_datagram: Callback that parses and dispatches a raw datagram.
+        """
+        self._handle_datagram = handle_datagram
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Hand the datagram over to the callback.
+
+        :param data: Raw OSC packet.
+        :param addr: Address of the sender.
+        """
+        self._handle_datagram(data)
+
 
 class VRChatOSCReceiver:
     """OSC receiver for VRChat parameters.
@@ -22,6 +107,9 @@ class VRChatOSCReceiver:
     tracks parameter states, and dispatches updates to registered handlers.
     """
 
+    # Kernel receive buffer size to absorb bursts of OSC messages
+    RECEIVE_BUFFER_SIZE = 1 << 20
+
     def __init__(
         self,
         ip: str = Config.VRCHAT_OSC_RECEIVE_IP,
@@ -29,18 +117,47 @@ class VRChatOSCReceiver:
     ) -> None:
         """Initialize the OSC receiver.
 
+        The socket is bound right away, messages are read and dispatched by a
+        single asyncio loop to keep parameter updates ordered, handlers marked
+        as blocking run on worker threads.
+
         :param ip: IP address to listen on for incoming OSC messages.
         :param port: Port to listen on for incoming OSC messages.
         """
         self.ip = ip
         self.port = port
-        self.dispatcher = Dispatcher()
-        self.dispatcher.map("/avatar/parameters/*", self._handle_parameter)
 
         self.parameters: dict[str, Any] = {}
+        # Interned parameter names per OSC address, VRChat keeps sending the same few addresses
+        self._parameter_names: dict[str, str] = {}
         self.handlers: list["BaseHandler"] = []
+        # Handlers to notify per parameter name in registration order, parameters missing here go to
+        # wildcard handlers only
+        self._parameter_handlers: dict[str, _HandlerGroup] = {}
+        self._wildcard_handlers: _HandlerGroup = []
+        self._workers: dict["BaseHandler", _HandlerWorker] = {}
 
-        self.server = BlockingOSCUDPServer((self.ip, self.port), self.dispatcher)
+        family, _, _, _, address = socket.getaddrinfo(self.ip, self.port, type=socket.SOCK_DGRAM)[0]
+        self.socket = socket.socket(family, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECEIVE_BUFFER_SIZE)
+        self.socket.bind(address)
+
+    def _handle_datagram(self, data: bytes) -> None:
+        """Parse an OSC packet and handle the avatar parameter messages it contains.
+
+        Bundle time tags are ignored, VRChat sends every message for immediate use.
+
+        :param data: Raw OSC packet.
+        """
+        try:
+            packet = OscPacket(data)
+        except ParseError as error:
+            logger.debug("Dropped malformed OSC packet: %s", error)
+            return
+        for timed_message in packet.messages:
+            message = timed_message.message
+            if message.address.startswith(_PARAMETER_ADDRESS_PREFIX):
+                self._handle_parameter(message.address, *message.params)
 
     def _handle_parameter(self, address: str, *args: Any) -> None:
         """Handle incoming OSC parameter messages.
@@ -48,18 +165,22 @@ class VRChatOSCReceiver:
         :param address: OSC address pattern of the message.
         :param args: OSC message arguments (parameter values).
         """
-        param_name = address.split("/")[-1]
+        param_name = self._parameter_names.get(address)
+        if param_name is None:
+            param_name = sys.intern(address.rpartition("/")[2])
+            self._parameter_names[address] = param_name
         value = args[0] if args else None
 
-        old_value = self.parameters.get(param_name)
+        old_value = self.parameters.get(param_name, _UNSET)
+        if old_value is value or old_value == value:
+            return
         self.parameters[param_name] = value
 
-        if old_value != value:
-            for handler in self.handlers:
-                try:
-                    handler.on_parameter_changed(param_name, value)
-                except Exception as error:
-                    logger.error(f"Error in handler {handler.__class__.__name__} for '{param_name}': {error}")
+        for handler, handler_name in self._parameter_handlers.get(param_name, self._wildcard_handlers):
+            try:
+                handler.on_parameter_changed(param_name, value)
+            except Exception as error:
+                logger.error("Error in handler %s for '%s': %s", handler_name, param_name, error)
 
     def add_handler(self, handler: "BaseHandler") -> None:
         """Register a new handler to receive parameter updates.
@@ -67,9 +188,46 @@ class VRChatOSCReceiver:
         :param handler: Instance of BaseHandler or subclass to register.
         """
         self.handlers.append(handler)
-        logger.info(f"Registered handler: {handler.__class__.__name__}")
+        if handler.BLOCKING:
+            self._workers[handler] = _HandlerWorker(handler)
+        self._rebuild_dispatch_index()
+        logger.info("Registered handler: %s", handler.__class__.__name__)
+
+    def _rebuild_dispatch_index(self) -> None:
+        """Group registered handlers by subscribed parameter, keeping registration order."""
+        self._wildcard_handlers = self._group_handlers(
+            [handler for handler in self.handlers if handler.SUBSCRIBED_PARAMETERS is None]
+        )
+        subscribed_parameters = {
+            parameter for handler in self.handlers for parameter in handler.SUBSCRIBED_PARAMETERS or ()
+        }
+        self._parameter_handlers = {
+            parameter: self._group_handlers(
+                [
+                    handler
+                    for handler in self.handlers
+                    if handler.SUBSCRIBED_PARAMETERS is None or parameter in handler.SUBSCRIBED_PARAMETERS
+                ]
+            )
+            for parameter in subscribed_parameters
+        }
+
+    def _group_handlers(self, handlers: list["BaseHandler"]) -> _HandlerGroup:
+        """Pair handlers with their class name, replacing blocking handlers by their workers."""
+        return [(self._workers.get(handler, handler), type(handler).__name__) for handler in handlers]
+
+    async def run(self) -> None:
+        """Listen for incoming messages on the running event loop indefinitely."""
+        logger.info("Starting OSC server...")
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _OSCProtocol(self._handle_datagram), sock=self.socket
+        )
+        try:
+            await loop.create_future()
+        finally:
+            transport.close()
 
     def serve_forever(self) -> None:
         """Start the OSC server to listen for incoming messages indefinitely."""
-        logger.info("Starting OSC server...")
-        self.server.serve_forever()
+        asyncio.run(self.run())
@@ -4,6 +4,7 @@ Defines VRChatOSCSender to send OSC parameter updates to VRChat.
 """
 
 import logging
+import threading
 
 from pythonosc.osc_message_builder import ArgValue
 from pythonosc.udp_client import SimpleUDPClient
@@ -16,21 +17,33 @@ logger = logging.getLogger(__name__)
 class VRChatOSCSender:
     """OSC sender to transmit parameters to VRChat."""
 
-    def __init__(self, ip: str = Config.VRCHAT_OSC_SEND_IP, port: int = Config.VRCHAT_OSC_SEND_PORT) -> None:
+    def __init__(
+        self,
+        ip: str = Config.VRCHAT_OSC_SEND_IP,
+        port: int = Config.VRCHAT_OSC_SEND_PORT,
+        chat_debounce_time: float = 0.25,
+    ) -> None:
         """Initialize the OSC sender.
 
         :param ip: IP address of the OSC server (VRChat).
         :param port: Port for sending OSC messages.
+        :param chat_debounce_time: Seconds without new chat messages before the latest one is sent.
+            Zero sends every chat message immediately.
         """
         self.client = SimpleUDPClient(ip, port)
 
+        self._chat_debounce_time = chat_debounce_time
+        self._chat_lock = threading.Lock()
+        self._pending_chat: list[str | bool] | None = None
+        self._chat_timer: threading.Timer | None = None
+
     def send_parameter(self, parameter: str, values: ArgValue) -> None:
         """Send a parameter value to VRChat.
 
         :param parameter: Name of the parameter.
         :param values: Value to send (float, int, bool, or str, or list of those values).
         """
-        logger.info(f"Sending: {parameter} = {values}")
+        logger.info("Sending: %s = %s", parameter, values)
         self.client.send_message(parameter, values)
 
     def send_to_chat(
@@ -39,5 +52,31 @@ class VRChatOSCSender:
         to_send_immediately: bool = True,
         to_send_notification: bool = False,
     ) -> None:
-        """Send the given text to VRChat textbox."""
-        self.send_parameter("/chatbox/input", values=[text, to_send_immediately, to_send_notification])
+        """Send the given text to VRChat textbox.
+
+        Messages arriving within the debounce time of each other are coalesced,
+        only the latest one is sent once no new message came for that long.
+        """
+        values: list[str | bool] = [text, to_send_immediately, to_send_notification]
+        if self._chat_debounce_time <= 0:
+            self.send_parameter("/chatbox/input", values=values)
+            return
+
+        with self._chat_lock:
+            self._pending_chat = values
+            if self._chat_timer is not None:
+                self._chat_timer.cancel()
+            self._chat_timer = threading.Timer(self._chat_debounce_time, self._flush_chat)
+            self._chat_timer.daemon = True
+            self._chat_timer.start()
+
+    def _flush_chat(self) -> None:
+        """Send the latest pending chat message, if any."""
+        with self._chat_lock:
+            if self._chat_timer is not threading.current_thread():
+                # Superseded by a newer message that restarted the debounce timer
+                return
+            values, self._pending_chat = self._pending_chat, None
+            self._chat_timer = None
+        if values is not None:
+            self.send_parameter("/chatbox/input", values=values)
@@ -1,7 +1,7 @@
 """Base handler abstraction for VRChat OSC events."""
 
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from vrchat_osc_scripts.clients.receiver import VRChatOSCReceiver
 from vrchat_osc_scripts.clients.sender import VRChatOSCSender
@@ -14,6 +14,13 @@ class BaseHandler(metaclass=ABCMeta):
     current parameter state and send new OSC messages in response to changes.
     """
 
+    # Parameter names the handler reacts to, ``None`` subscribes to every parameter
+    SUBSCRIBED_PARAMETERS: ClassVar[tuple[str, ...] | None] = None
+
+    # Blocking handlers (e.g. doing HTTP calls) run on a dedicated worker thread
+    # so they never stall the OSC reader
+    BLOCKING: ClassVar[bool] = False
+
     def __init__(self, sender: VRChatOSCSender, receiver: VRChatOSCReceiver) -> None:
         """Create a new handler.
 
@@ -28,7 +35,8 @@ class BaseHandler(metaclass=ABCMeta):
         """React to a single OSC parameter change.
 
         Subclasses must override this method to implement their own behaviour
-        when a parameter update is received.
+        when a parameter update is received. Only parameters listed in
+        ``SUBSCRIBED_PARAMETERS`` are delivered, unless it is ``None``.
 
         :param parameter: The OSC parameter name, e.g. ``"GestureLeft"``.
         :param value: The new value of the parameter.
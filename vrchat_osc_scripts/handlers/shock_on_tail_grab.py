@@ -23,6 +23,9 @@ class ShockOnTailGrabHandler(BaseHandler):
     it calls the PiShock API to deliver a shock with the configured client.
     """
 
+    SUBSCRIBED_PARAMETERS = (f"{Config.AVATAR_TAIL_PARAMETER_NAME}_IsGrabbed",)
+    BLOCKING = True
+
     def __init__(
         self,
         sender: VRChatOSCSender,
@@ -47,11 +50,10 @@ class ShockOnTailGrabHandler(BaseHandler):
         :param parameter: The name of the changed parameter.
         :param value: The new value of the parameter.
         """
-        if parameter == f"{Config.AVATAR_TAIL_PARAMETER_NAME}_IsGrabbed":
-            logger.info(f"Tracked parameter changed: {parameter} = {value}")
-            self._is_tail_grabbed = value
-            if not self._is_tail_grabbed:
-                self.send_shock()
+        logger.info("Tracked parameter changed: %s = %s", parameter, value)
+        self._is_tail_grabbed = value
+        if not self._is_tail_grabbed:
+            self.send_shock()
 
     def send_shock(self) -> None:
         """Send a shock using the PiShock client and notify VRChat via OSC chat.
@@ -1,15 +1,24 @@
 """Simple script with error handling to prevent the .exe from exiting immediately on error."""
 
 try:
-    import os
+    import sys
 
     import main
 
-    # Strange windows thing to support console colors
-    # Ignore Bandit warnings since we spawn the simplest possible process
-    # to clear the just-created Command Prompt window.
-    # B605: Starting a process with a shell. B607: Starting a process with a partial executable path
-    os.system("cls")  # nosec B605, B607
+    # Strange windows thing to support console colors:
+    # enable VT100 escape sequence processing on the console directly,
+    # instead of spawning a shell to clear the just-created Command Prompt window.
+    if sys.platform == "win32":
+        import ctypes
+
+        STD_OUTPUT_HANDLE = -11
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+        kernel32 = ctypes.windll.kernel32
+        stdout_handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+        console_mode = ctypes.c_ulong()
+        if kernel32.GetConsoleMode(stdout_handle, ctypes.byref(console_mode)):
+            kernel32.SetConsoleMode(stdout_handle, console_mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
 
     main.main()
 except Exception:
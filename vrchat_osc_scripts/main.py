@@ -10,7 +10,7 @@ from vrchat_osc_scripts.clients.pishock import PiShockClient
 from vrchat_osc_scripts.clients.receiver import VRChatOSCReceiver
 from vrchat_osc_scripts.clients.sender import VRChatOSCSender
 from vrchat_osc_scripts.handlers.shock_on_tail_grab import ShockOnTailGrabHandler
-from vrchat_osc_scripts.tools.logger import setup_logging
+from vrchat_osc_scripts.tools.logger import setup_logging, shutdown_logging
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,8 @@ def main() -> None:
         receiver.serve_forever()
     except KeyboardInterrupt:
         logger.info("Shutting down")
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":
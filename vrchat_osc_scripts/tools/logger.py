@@ -4,15 +4,32 @@ Python logging helper that provides colourised console output and daily‑rotate
 log files written beneath a *logs/* directory next to the running process.
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
+import re
 import sys
-from logging.handlers import TimedRotatingFileHandler
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 __all__: Final[list[str]] = [
     "setup_logging",
+    "shutdown_logging",
+    "CachedTimeFormatter",
     "ColourFormatter",
+    "JsonLinesFormatter",
+    "PrecompiledFormatter",
+    "PeriodicMemoryHandler",
+    "BatchingStreamHandler",
+    "BatchingQueueListener",
+    "BufferedTimedRotatingFileHandler",
 ]
 
 # ---------------------------------------------------------------------------
@@ -27,58 +44,471 @@ LEVEL_COLOURS: Final[dict[int, str]] = {
     logging.DEBUG: "\033[90m",
 }
 
+# ``%(levelname)`` field of a %-style format string, with its conversion flags and width
+_LEVEL_NAME_FIELD: Final = re.compile(r"%\(levelname\)([-#0 +]*\d*)s")
 
-class ColourFormatter(logging.Formatter):
+# Background thread writing queued records to the real handlers
+_listener: "BatchingQueueListener | None" = None
+# Root logger handler feeding the listener's queue
+_queue_handler: QueueHandler | None = None
+# Arguments the running listener was set up with
+_setup_arguments: tuple[Any, ...] | None = None
+
+
+@contextmanager
+def _holding_lock(handler: logging.Handler) -> Iterator[None]:
+    """Hold the I/O lock of *handler*, through acquire and release as ``Handler.lock`` may be None."""
+    handler.acquire()
+    try:
+        yield
+    finally:
+        handler.release()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs ``strftime`` at most once per second of record time."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        # Whole second of the last formatted record and its formatted time, swapped as one tuple
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return the creation time of *record*, reusing the text of the same second."""
+        second = int(record.created)
+        cached_second, formatted_time = self._cached_time
+        if second != cached_second:
+            formatted_time = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached_time = (second, formatted_time)
+        if datefmt or not self.default_msec_format:
+            return formatted_time
+        return self.default_msec_format % (formatted_time, record.msecs)
+
+
+class PrecompiledFormatter(CachedTimeFormatter):
+    """Formatter with the padded name of every standard level baked into its format string.
+
+    The record itself is never mutated, a record of a standard level is
+    formatted with a single % substitution. Format strings of other styles
+    fall back to the stock formatting, with the whole line coloured.
+    """
+
+    # Colour escape per level, empty for uncoloured output
+    LEVEL_COLOURS: Mapping[int, str] = dict.fromkeys(LEVEL_COLOURS, "")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the formatter and precompile one format string per level."""
+        super().__init__(*args, **kwargs)
+        # Formatter always takes the format string from its style, the stubs still allow None
+        fmt = self._fmt or ""
+        self._level_formats: dict[int, str] = {
+            level: self._compile_level_format(fmt, level, colour_escape)
+            for level, colour_escape in self.LEVEL_COLOURS.items()
+        }
+        self._default_format = self._wrap(fmt, "")
+        self._uses_time = self.usesTime()
+        # Subclasses of PercentStyle use other placeholders, only the exact style can be precompiled
+        self._is_precompiled = type(self._style) is logging.PercentStyle
+
+    def _wrap(self, text: str, colour_escape: str) -> str:
+        """Return *text* with the colour escape in front and a reset behind, if the formatter colours."""
+        return f"{colour_escape}{text}{RESET_ESCAPE}" if any(self.LEVEL_COLOURS.values()) else text
+
+    def _compile_level_format(self, fmt: str, level: int, colour_escape: str) -> str:
+        """Return *fmt* for *level* with its padded, coloured name in place of ``%(levelname)``."""
+        level_name = logging.getLevelName(level)
+        level_format = _LEVEL_NAME_FIELD.sub(
+            lambda match: self._wrap(f"%{match.group(1)}s" % level_name, colour_escape).replace("%", "%%"),
+            fmt,
+        )
+        return self._wrap(level_format, colour_escape)
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format *record*, skipping the exception and stack branches when it has neither.
+
+        Only the standard ``message`` and ``asctime`` attributes are set on the
+        record, the same for every formatter, so one record can be formatted by
+        several handlers concurrently.
+        """
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        return self.formatMessage(record)
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Return the formatted message for *record*."""
+        if self._is_precompiled:
+            return self._level_formats.get(record.levelno, self._default_format) % record.__dict__
+        return self._wrap(super().formatMessage(record), self.LEVEL_COLOURS.get(record.levelno, ""))
+
+
+class ColourFormatter(PrecompiledFormatter):
     """Formatter that adds ANSI colours *only* to the console handler."""
 
+    LEVEL_COLOURS = LEVEL_COLOURS
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter that writes each record as a compact JSON array on its own line.
+
+    The array holds the creation timestamp, level number, logger name and message.
+    Nothing is converted to local time or padded, which makes it cheaper than text.
+    """
+
+    _encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
     def format(self, record: logging.LogRecord) -> str:
-        """Return the formatted message for *record* with colour adornment."""
-        colour_escape = LEVEL_COLOURS.get(record.levelno, "")
-        original_level_name = record.levelname
-        record.levelname = f"{colour_escape}{original_level_name}{RESET_ESCAPE}"
-        formatted = super().format(record)
-        record.levelname = original_level_name
-        return f"{colour_escape}{formatted}{RESET_ESCAPE}"
+        """Return *record* encoded as a JSON array."""
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        return self._encode((record.created, record.levelno, record.name, message))
+
+
+class BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """Timed rotating file handler that writes through a large buffer.
+
+    Unlike the stock handler it does not flush after every record, callers
+    flush explicitly once per batch. Rollover is driven by a timer thread and
+    rollover_if_due, a clock check once per batch instead of on every record.
+    """
+
+    BUFFER_SIZE: Final = 1 << 20
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the handler and schedule its first rollover."""
+        super().__init__(*args, **kwargs)
+        self._rollover_timer: threading.Timer | None = None
+        self._is_closed = False
+        self._schedule_rollover()
+
+    def _schedule_rollover(self) -> None:
+        """Start a daemon timer that fires at the next rollover time."""
+        self._rollover_timer = threading.Timer(max(self.rolloverAt - time.time(), 0), self._rollover_on_time)
+        self._rollover_timer.daemon = True
+        self._rollover_timer.start()
+
+    def _rollover_on_time(self) -> None:
+        """Roll the file over if due, then schedule the next rollover."""
+        with _holding_lock(self):
+            if self._is_closed:
+                return
+            # The timer may wake up slightly early, in which case it is just rescheduled
+            self.rollover_if_due()
+            self._schedule_rollover()
+
+    def rollover_if_due(self) -> None:
+        """Roll the file over if the rollover time has passed.
+
+        Called once per batch as well, so records are not written to the old
+        file when the timer wakes up late, e.g. after the machine was suspended.
+        """
+        with _holding_lock(self):
+            if self._is_closed or time.time() < self.rolloverAt:
+                return
+            try:
+                self.doRollover()
+            except Exception:
+                self.handleError(logging.makeLogRecord({"msg": "Failed to roll over the log file"}))
+
+    def _open(self) -> Any:
+        """Open the log file with a large write buffer."""
+        return open(
+            self.baseFilename, self.mode, buffering=self.BUFFER_SIZE, encoding=self.encoding, errors=self.errors
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write *record* to the buffered file."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Cancel the rollover timer and close the file."""
+        with _holding_lock(self):
+            self._is_closed = True
+            if self._rollover_timer is not None:
+                self._rollover_timer.cancel()
+        super().close()
+
+
+class BatchingStreamHandler(logging.StreamHandler):
+    """Stream handler that collects formatted records and writes them in one call.
+
+    The batch is written on flush, or once it holds *capacity* records.
+    BatchingQueueListener flushes it whenever the log queue runs empty.
+    """
+
+    def __init__(self, stream: Any = None, capacity: int = 256) -> None:
+        """Create the handler.
+
+        :param stream: Stream to write to, stderr by default.
+        :param capacity: Number of records to collect before writing regardless of flushes.
+        """
+        super().__init__(stream)
+        self._capacity = capacity
+        self._batch: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Add the formatted *record* to the current batch."""
+        try:
+            self._batch.append(self.format(record) + self.terminator)
+            if len(self._batch) >= self._capacity:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write the current batch with a single write call and flush the stream.
+
+        The batch is taken before writing, so a failing write drops it instead
+        of failing again on every later flush. Errors go to handleError and
+        never reach the listener thread.
+        """
+        with _holding_lock(self):
+            batch, self._batch = self._batch, []
+            try:
+                if batch:
+                    self.stream.write("".join(batch))
+                super().flush()
+            except Exception:
+                self.handleError(
+                    logging.makeLogRecord({"msg": "Failed to write %d batched log records", "args": (len(batch),)})
+                )
+
+    def close(self) -> None:
+        """Write out the current batch and close the handler."""
+        self.flush()
+        super().close()
+
+
+class BatchingQueueListener(QueueListener):
+    """Queue listener that flushes batching handlers each time the queue is drained."""
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue[logging.LogRecord],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        """Create the listener for *log_queue*, see QueueListener for the arguments."""
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._log_queue = log_queue
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Flush batching handlers before waiting on an empty queue, then dequeue a record."""
+        if block and self._log_queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, BatchingStreamHandler):
+                    handler.flush()
+        return super().dequeue(block)
+
+
+class PeriodicMemoryHandler(MemoryHandler):
+    """Memory handler that also flushes its buffer on a fixed interval.
+
+    Records are written to the target in batches, when the buffer is full,
+    on ERROR or above, or at least every *flush_interval* seconds. Closing the
+    handler flushes the buffer and closes the target as well.
+    """
+
+    def __init__(self, capacity: int, target: logging.Handler, flush_interval: float) -> None:
+        """Create the handler and start its flush thread.
+
+        :param capacity: Number of records to buffer before flushing.
+        :param target: Handler that receives the buffered records.
+        :param flush_interval: Maximum number of seconds a record stays buffered.
+        """
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self._flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="LogFlusher", daemon=True).start()
+
+    def flush(self) -> None:
+        """Hand buffered records to the target and flush it once for the whole batch.
+
+        A failing target flush goes to handleError, so neither the listener
+        nor the flush thread dies on a full disk.
+        """
+        # Read once, close() on another thread may reset the attribute to None at any point
+        target = self.target
+        if isinstance(target, BufferedTimedRotatingFileHandler):
+            target.rollover_if_due()
+        super().flush()
+        with _holding_lock(self):
+            if target is not None:
+                try:
+                    target.flush()
+                except Exception:
+                    self.handleError(logging.makeLogRecord({"msg": "Failed to flush the log file"}))
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush interval until the handler is closed."""
+        while not self._stop_flushing.wait(self._flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread, flush the buffer and close the target handler."""
+        self._stop_flushing.set()
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+def _level_number(level: int | str) -> int:
+    """Return the numeric value of a level given by number or name."""
+    if isinstance(level, int):
+        return level
+    level_number = logging.getLevelName(level.upper())
+    if not isinstance(level_number, int):
+        raise ValueError(f"Unknown logging level: {level}")
+    return level_number
+
+
+def _should_use_colour(force_colour: bool | None, stream: Any) -> bool:
+    """Return whether console output written to *stream* should contain ANSI colour escapes.
+
+    *stream* is None for a process without a console, e.g. under pythonw.
+    """
+    if force_colour is not None:
+        return force_colour
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    return stream is not None and stream.isatty()
 
 
 def setup_logging(
     log_dir: str | Path = "logs",
     log_file_name: str = "app.log",
     level: int | str = logging.INFO,
+    flush_interval: float = 1.0,
+    force_colour: bool | None = None,
+    json_file: bool = False,
+    file_level: int | str | None = None,
+    console_level: int | str | None = None,
 ) -> None:
-    """Initialise root logger with file + colourised console handlers."""
+    """Initialise root logger with file + colourised console handlers.
+
+    Records are only enqueued on the calling thread, formatting and writing
+    happen on a background listener thread. The queue is unbounded, so logging
+    never blocks the caller, a stalled disk or console only grows memory use.
+    File writes are batched and happen at least every *flush_interval* seconds.
+    Console colours are used only on a terminal, unless *force_colour* or the
+    ``NO_COLOR``/``FORCE_COLOR`` environment variables say otherwise.
+    With *json_file* the log file gets JSON lines instead of text, see JsonLinesFormatter.
+    *file_level* and *console_level* default to *level*. The root logger is set
+    to the lower of the two, so records neither handler wants are never created.
+    Calling it again with the same arguments keeps the running handlers.
+    """
+    global _listener, _queue_handler, _setup_arguments
+
+    file_level = _level_number(level if file_level is None else file_level)
+    console_level = _level_number(level if console_level is None else console_level)
+    setup_arguments = (
+        os.path.abspath(log_dir),
+        log_file_name,
+        flush_interval,
+        force_colour,
+        json_file,
+        file_level,
+        console_level,
+    )
+    if _listener is not None and setup_arguments == _setup_arguments:
+        return
 
     root_logger = logging.getLogger()
 
+    shutdown_logging()
     for h in root_logger.handlers[:]:
         root_logger.removeHandler(h)
 
-    root_logger.setLevel(level)
+    root_logger.setLevel(min(file_level, console_level))
+
+    # The log format uses no thread, process or task fields, skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if sys.version_info >= (3, 12):
+        logging.logAsyncioTasks = False
 
     # Ensure logs directory exists
-    resolved_log_dir = Path(log_dir).resolve()
-    resolved_log_dir.mkdir(parents=True, exist_ok=True)
-    log_file_path = resolved_log_dir / log_file_name
+    resolved_log_dir = os.path.abspath(log_dir)
+    os.makedirs(resolved_log_dir, exist_ok=True)
+    log_file_path = os.path.join(resolved_log_dir, log_file_name)
 
     # Logging format strings (old style)
     log_format = "%(asctime)s %(levelname)-8s %(name)s – %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
-    plain_formatter = logging.Formatter(log_format, datefmt=date_format)
+    plain_formatter = PrecompiledFormatter(log_format, datefmt=date_format)
 
     # File handler
-    file_handler = TimedRotatingFileHandler(
+    file_handler = BufferedTimedRotatingFileHandler(
         filename=log_file_path,
         when="midnight",
         backupCount=0,
         encoding="utf-8",
         utc=False,
     )
-    file_handler.setFormatter(plain_formatter)
+    file_handler.setFormatter(JsonLinesFormatter() if json_file else plain_formatter)
+    buffered_file_handler = PeriodicMemoryHandler(capacity=512, target=file_handler, flush_interval=flush_interval)
+    buffered_file_handler.setLevel(file_level)
+
+    # Console handler, with colour only where escapes are rendered
+    stream_handler = BatchingStreamHandler(stream=sys.stdout)
+    stream_handler.setLevel(console_level)
+    if _should_use_colour(force_colour, stream_handler.stream):
+        stream_handler.setFormatter(ColourFormatter(log_format, datefmt=date_format))
+    else:
+        stream_handler.setFormatter(plain_formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _listener = BatchingQueueListener(log_queue, buffered_file_handler, stream_handler, respect_handler_level=True)
+    _listener.start()
+    _setup_arguments = setup_arguments
+
+
+def shutdown_logging() -> None:
+    """Write out all queued records and close the handlers started by setup_logging.
+
+    The globals are reset first, so a handler failing to close never leaves a
+    half stopped listener behind, and the remaining handlers are still closed.
+    """
+    global _listener, _queue_handler, _setup_arguments
+
+    listener, queue_handler = _listener, _queue_handler
+    _listener = None
+    _queue_handler = None
+    _setup_arguments = None
+
+    if queue_handler is not None:
+        logging.getLogger().removeHandler(queue_handler)
+    if listener is None:
+        return
+    try:
+        listener.stop()
+    finally:
+        for handler in listener.handlers:
+            try:
+                handler.close()
+            except Exception:
+                handler.handleError(
+                    logging.makeLogRecord({"msg": "Failed to close log handler %r", "args": (handler,)})
+                )
 
-    # Console handler with colour
-    stream_handler = logging.StreamHandler(stream=sys.stdout)
-    stream_handler.setFormatter(ColourFormatter(log_format, datefmt=date_format))
 
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(stream_handler)
+# Drain queued records even when the application exits without calling shutdown_logging
+atexit.register(shutdown_logging)